@@ -1,6 +1,9 @@
+import io
 import re
 from book_translator.logger import system_logger
 
+_SCENE_MARKER_RE = re.compile(r'^(\s*\[\]\s*|\s*---\s*)$')
+
 
 def split_chapter_intelligently(
     chapter_file_path,
@@ -18,6 +21,26 @@ def split_chapter_intelligently(
     with open(chapter_file_path, 'r', encoding='utf-8') as f:
         lines = f.readlines()
 
+    return _split_lines(lines, target_chars, max_part_chars, min_chunk_size)
+
+
+def split_chapter_text_intelligently(
+    source_text,
+    target_chars=3000,
+    max_part_chars=5000,
+    min_chunk_size=1,
+):
+    """Split chapter text already in memory; same rules as split_chapter_intelligently.
+
+    Returns:
+        list of {"id": int, "text": str}
+    """
+    # newline=None gives the same universal-newline handling as open() in text mode.
+    lines = io.StringIO(source_text, newline=None).readlines()
+    return _split_lines(lines, target_chars, max_part_chars, min_chunk_size)
+
+
+def _split_lines(lines, target_chars, max_part_chars, min_chunk_size):
     current_chunk_lines = []
     current_chunk_chars = 0
     chunk_num = 1
@@ -51,7 +74,7 @@ def split_chapter_intelligently(
         current_chunk_chars = 0
 
     def is_scene_marker(line):
-        return re.match(r'^(\s*\[\]\s*|\s*---\s*)$', line)
+        return _SCENE_MARKER_RE.match(line)
 
     def is_dialogue_start(line):
         stripped_line = line.strip()
@@ -60,15 +83,15 @@ def split_chapter_intelligently(
     def is_blank_line(line):
         return not line.strip()
 
-    def can_split_at(index: int) -> bool:
-        left_lines = current_chunk_lines[:index + 1]
-        right_lines = current_chunk_lines[index + 1:]
-        left_chars = sum(len(line) for line in left_lines)
-        right_chars = sum(len(line) for line in right_lines)
+    def can_split_at(index: int, right_chars: int) -> bool:
+        # right_chars is the length of current_chunk_lines[index + 1:]; the
+        # backward scans below keep it as a running sum instead of re-summing
+        # both halves for every candidate line.
+        left_chars = current_chunk_chars - right_chars
 
         if left_chars < min_chunk_size:
             return False
-        if right_lines and right_chars < min_chunk_size:
+        if index + 1 < len(current_chunk_lines) and right_chars < min_chunk_size:
             return False
         return True
 
@@ -80,26 +103,27 @@ def split_chapter_intelligently(
 
         if current_chunk_chars >= target_chars:
             best_break_index = -1
+            right_chars = 0
+            # Whether the first non-blank line after j opens a dialogue; tracked
+            # while scanning backwards rather than re-scanned for every blank line.
+            next_non_blank_line_is_dialogue = False
 
             for j in range(len(current_chunk_lines) - 1, -1, -1):
                 current_line_in_buffer = current_chunk_lines[j]
 
                 if is_scene_marker(current_line_in_buffer):
-                    if can_split_at(j):
+                    if can_split_at(j, right_chars):
                         best_break_index = j
                         break
 
                 if is_blank_line(current_line_in_buffer):
-                    next_non_blank_line_is_dialogue = False
-                    for k in range(j + 1, len(current_chunk_lines)):
-                        if not is_blank_line(current_chunk_lines[k]):
-                            if is_dialogue_start(current_chunk_lines[k]):
-                                next_non_blank_line_is_dialogue = True
-                            break
-
-                    if not next_non_blank_line_is_dialogue and can_split_at(j):
+                    if not next_non_blank_line_is_dialogue and can_split_at(j, right_chars):
                         best_break_index = j
                         break
+                else:
+                    next_non_blank_line_is_dialogue = bool(is_dialogue_start(current_line_in_buffer))
+
+                right_chars += len(current_line_in_buffer)
 
             if best_break_index != -1:
                 temp_lines = current_chunk_lines[best_break_index + 1:]
@@ -109,10 +133,12 @@ def split_chapter_intelligently(
                 current_chunk_chars = sum(len(l) for l in current_chunk_lines)
             elif current_chunk_chars >= max_part_chars:
                 force_break_index = -1
+                right_chars = 0
                 for j in range(len(current_chunk_lines) - 1, -1, -1):
-                    if is_blank_line(current_chunk_lines[j]) and can_split_at(j):
+                    if is_blank_line(current_chunk_lines[j]) and can_split_at(j, right_chars):
                         force_break_index = j
                         break
+                    right_chars += len(current_chunk_lines[j])
 
                 if force_break_index != -1:
                     temp_lines = current_chunk_lines[force_break_index + 1:]
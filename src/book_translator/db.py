@@ -25,12 +25,17 @@ def connection(db_path: Path):
     """Open a WAL-mode SQLite connection as a context manager.
     
     WAL mode must be enabled on a real file path (not :memory:).
+    synchronous=NORMAL is per-connection and safe under WAL: a commit no
+    longer fsyncs, only checkpoints do, and a crash can lose at most the
+    last commits — never corrupt the database.
     """
     conn = sqlite3.connect(str(db_path), timeout=30)
     conn.row_factory = sqlite3.Row
     conn.execute('PRAGMA foreign_keys = ON')
     if str(db_path) != ':memory:':
         conn.execute('PRAGMA journal_mode = WAL')
+        conn.execute('PRAGMA synchronous = NORMAL')
+    conn.execute('PRAGMA temp_store = MEMORY')
     try:
         yield conn
     finally:
@@ -139,6 +144,49 @@ def add_term(
         conn.commit()
 
 
+# Rows per multi-row INSERT in batch_add_terms (5 parameters each).
+_TERMS_PER_INSERT = 180
+
+
+def batch_add_terms(
+    db_path: Path,
+    rows: list[tuple[str, str, str]],
+    source_lang: str = 'ja',
+    target_lang: str = 'ru',
+) -> None:
+    """Upsert many glossary terms in a single transaction.
+
+    Same semantics as add_term; later rows win over earlier ones with the
+    same term_source.
+
+    Args:
+        db_path: Path to glossary.db.
+        rows: List of (term_source, term_target, comment) tuples.
+        source_lang: Source language code.
+        target_lang: Target language code.
+    """
+    # One multi-row INSERT per group instead of a statement step per row;
+    # groups stay under SQLite's default limit of 999 bound parameters.
+    with connection(db_path) as conn:
+        for start in range(0, len(rows), _TERMS_PER_INSERT):
+            group = rows[start:start + _TERMS_PER_INSERT]
+            params: list[str] = []
+            for term_source, term_target, comment in group:
+                params.extend((term_source, term_target, source_lang, target_lang, comment))
+            conn.execute(
+                f'''
+                INSERT INTO glossary
+                    (term_source, term_target, source_lang, target_lang, comment)
+                VALUES {", ".join(["(?, ?, ?, ?, ?)"] * len(group))}
+                ON CONFLICT(term_source, source_lang, target_lang) DO UPDATE SET
+                    term_target = excluded.term_target,
+                    comment     = excluded.comment
+                ''',
+                params,
+            )
+        conn.commit()
+
+
 def get_terms(
     db_path: Path,
     source_lang: str = 'ja',
@@ -158,6 +206,29 @@ def get_terms(
     return [dict(r) for r in rows]
 
 
+def get_term_rows(
+    db_path: Path,
+    source_lang: str = 'ja',
+    target_lang: str = 'ru',
+) -> list[tuple[str, str, str]]:
+    """Return (term_source, term_target, comment) tuples for a language pair.
+
+    Lighter than get_terms for bulk export: plain tuples instead of a dict
+    per row, ordered by term_source, with NULL comments as ''.
+    """
+    with connection(db_path) as conn:
+        conn.row_factory = None
+        return conn.execute(
+            '''
+            SELECT term_source, term_target, COALESCE(comment, '')
+            FROM glossary
+            WHERE source_lang = ? AND target_lang = ?
+            ORDER BY term_source
+            ''',
+            (source_lang, target_lang),
+        ).fetchall()
+
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Chunk operations
@@ -193,6 +264,39 @@ def add_chunk(
         conn.commit()
 
 
+def batch_add_chunks(
+    db_path: Path,
+    chapter_name: str,
+    chunks: list[tuple[int, str]],
+    status: str = 'discovery_pending',
+) -> None:
+    """Insert or update many chunks in a single transaction.
+
+    Same upsert semantics as add_chunk, with content_target reset to NULL.
+
+    Args:
+        db_path: Path to chunks.db.
+        chapter_name: Chapter the chunks belong to.
+        chunks: List of (chunk_index, content_source) tuples.
+        status: Initial status for every chunk.
+    """
+    with connection(db_path) as conn:
+        conn.executemany(
+            '''
+            INSERT INTO chunks
+                (chapter_name, chunk_index, content_source, content_target, status)
+            VALUES (?, ?, ?, NULL, ?)
+            ON CONFLICT(chapter_name, chunk_index) DO UPDATE SET
+                content_source = excluded.content_source,
+                content_target = excluded.content_target,
+                status         = excluded.status,
+                updated_at     = datetime('now')
+            ''',
+            [(chapter_name, chunk_index, content_source, status) for chunk_index, content_source in chunks],
+        )
+        conn.commit()
+
+
 def get_chunks(
     db_path: Path,
     chapter_name: str,
@@ -262,12 +366,11 @@ def batch_update_chunks_content(
     All updates are committed in a single transaction.
     """
     with connection(db_path) as conn:
-        for u in updates:
-            conn.execute(
-                'UPDATE chunks SET content_target = ?, status = ?, updated_at = datetime(\'now\') '
-                'WHERE chapter_name = ? AND chunk_index = ?',
-                (u['content_target'], u['status'], chapter_name, u['chunk_index']),
-            )
+        conn.executemany(
+            'UPDATE chunks SET content_target = ?, status = ?, updated_at = datetime(\'now\') '
+            'WHERE chapter_name = ? AND chunk_index = ?',
+            [(u['content_target'], u['status'], chapter_name, u['chunk_index']) for u in updates],
+        )
         conn.commit()
 
 
@@ -286,12 +389,11 @@ def batch_update_chunk_statuses(
     All updates commit together — partial application on crash is impossible.
     """
     with connection(db_path) as conn:
-        for chunk_index, new_status in updates:
-            conn.execute(
-                "UPDATE chunks SET status = ?, updated_at = datetime('now') "
-                "WHERE chapter_name = ? AND chunk_index = ?",
-                (new_status, chapter_name, chunk_index),
-            )
+        conn.executemany(
+            "UPDATE chunks SET status = ?, updated_at = datetime('now') "
+            "WHERE chapter_name = ? AND chunk_index = ?",
+            [(new_status, chapter_name, chunk_index) for chunk_index, new_status in updates],
+        )
         conn.commit()
 
 
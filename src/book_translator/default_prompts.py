@@ -9,6 +9,9 @@ Users can override any prompt by placing a file in {series_root}/prompts/
 Two sets of bundled prompts are provided:
   PROMPTS       — full-detail prompts optimised for cloud models (Gemini)
   LOCAL_PROMPTS — simplified prompts optimised for local models (Ollama)
+
+"fused_pipeline" is cloud-only: it drives the single-pass discovery +
+translation + proofreading mode enabled by `workers.fused_pipeline`.
 """
 
 from importlib import resources
@@ -31,6 +34,7 @@ PROMPTS: dict[str, str] = {
     "term_discovery": _load("term_discovery"),
     "proofreading": _load("proofreading"),
     "global_proofreading": _load("global_proofreading"),
+    "fused_pipeline": _load("fused_pipeline"),
 }
 
 LOCAL_PROMPTS: dict[str, str] = {
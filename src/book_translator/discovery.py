@@ -2,6 +2,10 @@
 Series discovery module.
 Implements walk-up algorithm to find book-translator.toml from CWD.
 """
+import copy
+import functools
+import os
+import stat
 from pathlib import Path
 
 import tomllib
@@ -15,16 +19,32 @@ def find_series_root(start_dir: Path | None = None) -> Path:
     Returns the directory containing the marker file.
     Raises FileNotFoundError if not found anywhere up to filesystem root.
     """
-    current = (start_dir or Path.cwd()).resolve()
-    while current != current.parent:
-        if (current / MARKER_FILE).is_file():
-            return current
-        current = current.parent
+    # Resolve once, then walk plain strings: one stat() per level, no Path objects.
+    current = str((start_dir or Path.cwd()).resolve())
+    parent = os.path.dirname(current)
+    while current != parent:
+        if os.path.isfile(os.path.join(current, MARKER_FILE)):
+            return Path(current)
+        current, parent = parent, os.path.dirname(parent)
     raise FileNotFoundError(
         f"{MARKER_FILE} not found. Run `book-translator init` to create a series."
     )
 
 
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse, default and validate a config file.
+
+    mtime_ns and size are part of the cache key so edits invalidate it.
+    Callers must not mutate the returned dict.
+    """
+    with open(path, 'rb') as f:
+        config = tomllib.load(f)
+    _apply_defaults(config)
+    _validate_config(config)
+    return config
+
+
 def load_series_config(series_root: Path) -> dict:
     """Load and parse book-translator.toml with defaults applied.
     
@@ -37,12 +57,24 @@ def load_series_config(series_root: Path) -> dict:
         ValueError: if required fields are missing
     """
     toml_path = series_root / MARKER_FILE
-    if not toml_path.is_file():
+    try:
+        st = toml_path.stat()
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise FileNotFoundError(f"{MARKER_FILE} not found at {series_root}")
-    
-    with open(toml_path, 'rb') as f:
-        config = tomllib.load(f)
-    
+
+    # The TUI screens reload the config on every refresh; parsing, defaults and
+    # validation run once per file version. Hand out a copy so callers may mutate it.
+    return copy.deepcopy(_load_config_cached(str(toml_path), st.st_mtime_ns, st.st_size))
+
+
+def _apply_defaults(config: dict) -> None:
+    """Check required fields and fill in defaults in place.
+
+    Raises:
+        ValueError: if required fields are missing
+    """
     # Validate required fields
     if 'series' not in config:
         raise ValueError("Missing required [series] section in book-translator.toml")
@@ -69,6 +101,17 @@ def load_series_config(series_root: Path) -> dict:
         config['workers'] = {}
     config['workers'].setdefault('max_concurrent', 50)
     config['workers'].setdefault('max_rps', 2.0)
+    # Provider quotas (requests/min, tokens/min, requests/day); 0 disables a limit.
+    config['workers'].setdefault('max_rpm', 0)
+    config['workers'].setdefault('max_tpm', 0)
+    config['workers'].setdefault('max_rpd', 0)
+    # Opt-in: run discovery + translation + proofreading as one LLM call per chunk.
+    config['workers'].setdefault('fused_pipeline', False)
+    # Chunks per LLM call; 1 keeps the classic one-call-per-chunk behaviour.
+    config['workers'].setdefault('batch_size', 1)
+    # Chunks per global-proofreading request; longer chapters are split into
+    # overlapping windows proofread in parallel. 0 sends the whole chapter at once.
+    config['workers'].setdefault('global_proofreading_window', 20)
 
     if 'llm' not in config:
         config['llm'] = {}
@@ -105,11 +148,6 @@ def load_series_config(series_root: Path) -> dict:
     config['llm']['options']['stage_temperature'].setdefault('proofreading', 0.3)
     config['llm']['options']['stage_temperature'].setdefault('global_proofreading', 0.1)
 
-    # Validate configuration values
-    _validate_config(config)
-
-    return config
-
 
 def _validate_config(config: dict) -> None:
     """Validate configuration values after defaults have been applied.
@@ -151,6 +189,32 @@ def _validate_config(config: dict) -> None:
             f"Invalid 'workers.max_rps': {max_rps!r}. Must be a number between 0.1 and 100."
         )
 
+    for key in ('max_rpm', 'max_tpm', 'max_rpd'):
+        val = config['workers'].get(key)
+        if not isinstance(val, int) or isinstance(val, bool) or val < 0:
+            raise ValueError(
+                f"Invalid 'workers.{key}': {val!r}. Must be a non-negative integer (0 disables the limit)."
+            )
+
+    batch_size = config['workers'].get('batch_size')
+    if not isinstance(batch_size, int) or isinstance(batch_size, bool) or not (1 <= batch_size <= 50):
+        raise ValueError(
+            f"Invalid 'workers.batch_size': {batch_size!r}. Must be an integer between 1 and 50."
+        )
+
+    window = config['workers'].get('global_proofreading_window')
+    if not isinstance(window, int) or isinstance(window, bool) or window < 0:
+        raise ValueError(
+            f"Invalid 'workers.global_proofreading_window': {window!r}. "
+            "Must be a non-negative integer (0 = whole chapter in one request)."
+        )
+
+    fused = config['workers'].get('fused_pipeline')
+    if not isinstance(fused, bool):
+        raise ValueError(
+            f"Invalid 'workers.fused_pipeline': {fused!r}. Must be true or false."
+        )
+
     # Validate retry parameters
     max_attempts = config['retry'].get('max_attempts')
     if not isinstance(max_attempts, int) or not (1 <= max_attempts <= 10):
@@ -168,9 +232,9 @@ def _validate_config(config: dict) -> None:
 
     # Validate llm backend
     backend = config['llm'].get('backend')
-    if backend not in ('gemini', 'ollama', 'qwen'):
+    if backend not in ('gemini', 'gemini_api', 'ollama', 'qwen'):
         raise ValueError(
-            f"Invalid 'llm.backend': {backend!r}. Must be 'gemini', 'qwen', or 'ollama'."
+            f"Invalid 'llm.backend': {backend!r}. Must be 'gemini', 'gemini_api', 'qwen', or 'ollama'."
         )
 
     # Validate ollama model names (non-empty strings)
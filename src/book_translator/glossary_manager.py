@@ -5,10 +5,11 @@ Provides functions to export glossary terms to TSV format,
 import terms from TSV files, and generate approval TSV buffers
 for LLM-discovered terms.
 """
+import csv
 from pathlib import Path
 from typing import TextIO
 
-from book_translator.db import add_term, get_terms
+from book_translator.db import batch_add_terms, get_term_rows
 
 TSV_HEADER = '# source_term\ttarget_term\tcomment'
 
@@ -16,12 +17,12 @@ TSV_HEADER = '# source_term\ttarget_term\tcomment'
 def export_tsv(db_path: Path, output: TextIO,
                source_lang: str = 'ja', target_lang: str = 'ru') -> int:
     """Export glossary to TSV format. Returns number of terms exported."""
-    terms = get_terms(db_path, source_lang, target_lang)
-    output.write(TSV_HEADER + '\n')
-    for term in terms:
-        line = f"{term['term_source']}\t{term['term_target']}\t{term.get('comment', '')}"
-        output.write(line + '\n')
-    return len(terms)
+    rows = get_term_rows(db_path, source_lang, target_lang)
+    lines = [TSV_HEADER]
+    lines.extend('\t'.join(row) for row in rows)
+    lines.append('')
+    output.write('\n'.join(lines))
+    return len(rows)
 
 
 def import_tsv(db_path: Path, tsv_path: Path,
@@ -31,23 +32,25 @@ def import_tsv(db_path: Path, tsv_path: Path,
     Format: source_term<TAB>target_term[<TAB>comment]
     Returns: number of terms imported
     """
-    count = 0
+    rows: list[tuple[str, str, str]] = []
     with open(tsv_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
+        # Lines are stripped first, as before, so leading/trailing whitespace
+        # and tabs never shift columns; csv does the tab split in C.
+        reader = csv.reader((line.strip() for line in f), delimiter='\t', quoting=csv.QUOTE_NONE)
+        for parts in reader:
+            if not parts or parts[0].startswith('#'):
                 continue
-            parts = line.split('\t')
             if len(parts) < 2:
                 continue  # skip malformed lines
             term_source = parts[0].strip()
             term_target = parts[1].strip()
             comment = parts[2].strip() if len(parts) > 2 else ''
             if term_source and term_target:
-                add_term(db_path, term_source, term_target,
-                         source_lang, target_lang, comment)
-                count += 1
-    return count
+                rows.append((term_source, term_target, comment))
+    # One transaction for the whole file instead of a commit per term.
+    if rows:
+        batch_add_terms(db_path, rows, source_lang, target_lang)
+    return len(rows)
 
 
 def generate_approval_tsv(terms: list[dict], output_path: Path):
@@ -55,13 +58,18 @@ def generate_approval_tsv(terms: list[dict], output_path: Path):
     This is the TSV 'approval buffer' — user edits this, then
     the approved version is imported into the DB.
     """
+    lines = [
+        '# Проверьте и отредактируйте термины ниже',
+        '# Удалите строки, которые не нужны',
+        '# Формат: исходный_термин<TAB>перевод<TAB>комментарий',
+        TSV_HEADER,
+    ]
+    for term in terms:
+        source = term.get('term_source') or term.get('term_jp', '')
+        target = term.get('term_target') or term.get('term_ru', '')
+        comment = term.get('comment', '')
+        lines.append(f"{source}\t{target}\t{comment}")
+    # Build the whole buffer first and write it in one call.
+    lines.append('')
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('# Проверьте и отредактируйте термины ниже\n')
-        f.write('# Удалите строки, которые не нужны\n')
-        f.write('# Формат: исходный_термин<TAB>перевод<TAB>комментарий\n')
-        f.write(TSV_HEADER + '\n')
-        for term in terms:
-            source = term.get('term_source') or term.get('term_jp', '')
-            target = term.get('term_target') or term.get('term_ru', '')
-            comment = term.get('comment', '')
-            f.write(f"{source}\t{target}\t{comment}\n")
+        f.write('\n'.join(lines))
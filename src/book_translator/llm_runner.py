@@ -5,13 +5,17 @@ Provides:
   run_gemini() — subprocess call to gemini-cli (cloud backend)
   run_qwen()   — subprocess call to qwen-code CLI (cloud backend)
   run_ollama() — HTTP call to local Ollama server (local backend)
+  run_gemini_api() — HTTP call to the Gemini REST API (cloud backend, no CLI)
   run_llm()    — dispatcher that routes to the correct backend
   check_qwen_binary()      — pre-flight check for qwen-code availability
+  check_gemini_api_key()   — pre-flight check for the Gemini API key
   check_ollama_connection() — pre-flight check for Ollama availability
   cancel_all() — abort all active LLM calls (called from UI cancel handler)
   reset_cancellation() — clear cancellation state before a new translation run
+  is_cancelled()       — whether cancel_all() is in effect (polled by long waits)
 """
 import json as _json
+import os
 import re as _re
 import shutil
 import subprocess
@@ -20,11 +24,14 @@ from functools import lru_cache
 from pathlib import Path
 
 import requests as _requests
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type, RetryCallState
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    retry, stop_after_attempt, wait_exponential, retry_if_exception, retry_if_exception_type, RetryCallState,
+)
 
 from book_translator.exceptions import CancellationError
 from book_translator.logger import system_logger, input_logger, output_logger
-from book_translator.rate_limiter import RateLimiter
+from book_translator.rate_limiter import RateLimiter, estimate_tokens
 from book_translator.utils import find_tool_versions_dir
 
 
@@ -89,11 +96,39 @@ def reset_cancellation() -> None:
     _cancelled.clear()
 
 
+def is_cancelled() -> bool:
+    """Return True once cancel_all() has been called and not yet reset."""
+    return _cancelled.is_set()
+
+
 @lru_cache(maxsize=1)
 def _get_subprocess_cwd() -> Path | None:
     return find_tool_versions_dir()
 
 
+# ── Shared HTTP session ──────────────────────────────────────────────────────
+# One keep-alive connection pool for all HTTP backends (Ollama, Gemini API).
+# Worker threads share it, so consecutive chunks reuse TCP/TLS connections
+# instead of paying a fresh handshake per call.
+_HTTP_POOL_SIZE = 64
+_http_session: _requests.Session | None = None
+_http_session_lock = _threading.Lock()
+
+
+def _get_http_session() -> _requests.Session:
+    """Return the process-wide requests.Session, creating it on first use."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = _requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_HTTP_POOL_SIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _http_session = session
+    return _http_session
+
+
 def run_gemini(
     prompt: str,
     model_name: str,
@@ -147,7 +182,7 @@ def run_gemini(
             raise _LLMCancelledError("LLM call cancelled")
         system_logger.info(f"[LLMRunner] Запущен воркер [id: {worker_id}] для: {label}")
         try:
-            with rate_limiter:
+            with rate_limiter.reserve(estimate_tokens(prompt)):
                 # Повторная проверка отмены после ожидания ограничителя скорости,
                 # чтобы устранить гонку между созданием процесса и его регистрацией.
                 if _cancelled.is_set():
@@ -274,7 +309,7 @@ def run_qwen(
             raise _LLMCancelledError("LLM call cancelled")
         system_logger.info(f"[LLMRunner] Запущен воркер [id: {worker_id}] для: {label}")
         try:
-            with rate_limiter:
+            with rate_limiter.reserve(estimate_tokens(prompt)):
                 if _cancelled.is_set():
                     raise _LLMCancelledError("LLM call cancelled")
                 with _registry_lock:
@@ -409,8 +444,8 @@ def run_ollama(
             raise _LLMCancelledError("LLM call cancelled")
         system_logger.info(f"[LLMRunner/Ollama] Запущен воркер [id: {worker_id}] для: {label} (модель: {model_name})")
         try:
-            with rate_limiter:
-                response = _requests.post(endpoint, json=payload, timeout=timeout)
+            with rate_limiter.reserve(estimate_tokens(prompt)):
+                response = _get_http_session().post(endpoint, json=payload, timeout=timeout)
             response.raise_for_status()
             text = response.json()["response"]
             # Strip <think>...</think> blocks — Qwen3 may emit these even when
@@ -433,6 +468,132 @@ def run_ollama(
     return stdout
 
 
+GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta"
+GEMINI_API_KEY_ENV_VARS = ("GEMINI_API_KEY", "GOOGLE_API_KEY")
+
+# 429 (quota) and 5xx responses from the Gemini API are transient.
+_GEMINI_API_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _get_gemini_api_key() -> str | None:
+    for var in GEMINI_API_KEY_ENV_VARS:
+        value = os.environ.get(var)
+        if value:
+            return value
+    return None
+
+
+def _is_retryable_gemini_api_error(exc: BaseException) -> bool:
+    if isinstance(exc, (_requests.exceptions.Timeout, _requests.exceptions.ConnectionError)):
+        return True
+    if isinstance(exc, _requests.exceptions.HTTPError) and exc.response is not None:
+        return exc.response.status_code in _GEMINI_API_RETRYABLE_STATUS
+    return False
+
+
+def _extract_gemini_api_response(data: dict) -> str:
+    """Extract the response text from a generateContent JSON body.
+
+    Raises:
+        ValueError: If the response has no candidates (e.g. blocked by safety filters).
+    """
+    candidates = data.get("candidates") or []
+    if not candidates:
+        feedback = data.get("promptFeedback", {})
+        raise ValueError(f"Gemini API не вернул ответа: {feedback}")
+    parts = candidates[0].get("content", {}).get("parts", [])
+    return "".join(part.get("text", "") for part in parts)
+
+
+def run_gemini_api(
+    prompt: str,
+    model_name: str,
+    output_format: str,
+    rate_limiter: RateLimiter,
+    timeout: int,
+    retry_attempts: int,
+    retry_wait_min: int,
+    retry_wait_max: int,
+    worker_id: str,
+    label: str,
+) -> str:
+    """Run a prompt against the Gemini REST API and return the response text.
+
+    Same models as the gemini backend, but without spawning a gemini-cli
+    process per call: requests go through the shared keep-alive session.
+    The API key is read from GEMINI_API_KEY (or GOOGLE_API_KEY).
+
+    Args:
+        prompt: The full prompt string to send.
+        model_name: Gemini model identifier.
+        output_format: 'text' or 'json'. 'json' sets responseMimeType to
+            application/json for structured output.
+        rate_limiter: Shared rate limiter instance.
+        timeout: HTTP request timeout in seconds.
+        retry_attempts: Max retry attempts on transient errors (timeouts, 429, 5xx).
+        retry_wait_min: Min wait between retries (seconds).
+        retry_wait_max: Max wait between retries (seconds).
+        worker_id: Short ID for logging.
+        label: Human-readable label for log messages (e.g. 'chunk_3').
+
+    Returns:
+        Response text from the model.
+
+    Raises:
+        RuntimeError: If no API key is configured.
+        requests.exceptions.HTTPError: On non-retryable HTTP errors or after exhausting retries.
+        requests.exceptions.Timeout: After exhausting retries.
+        ValueError: If the API returned no candidates.
+    """
+    if _cancelled.is_set():
+        raise _LLMCancelledError("LLM call cancelled")
+
+    api_key = _get_gemini_api_key()
+    if not api_key:
+        raise RuntimeError("Не задан ключ Gemini API (переменная окружения GEMINI_API_KEY).")
+
+    input_logger.info(f"[{worker_id}] --- PROMPT FOR: {label} ---\n{prompt}\n")
+
+    endpoint = f"{GEMINI_API_URL}/models/{model_name}:generateContent"
+    payload: dict = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+    if output_format == "json":
+        payload["generationConfig"] = {"responseMimeType": "application/json"}
+    headers = {"x-goog-api-key": api_key}
+
+    @retry(
+        stop=stop_after_attempt(retry_attempts),
+        wait=wait_exponential(multiplier=1, min=retry_wait_min, max=retry_wait_max),
+        retry=retry_if_exception(_is_retryable_gemini_api_error),
+        before_sleep=_before_sleep_check_cancelled,
+        reraise=True,
+    )
+    def _execute() -> str:
+        if _cancelled.is_set():
+            raise _LLMCancelledError("LLM call cancelled")
+        system_logger.info(f"[LLMRunner/GeminiAPI] Запущен воркер [id: {worker_id}] для: {label}")
+        try:
+            with rate_limiter.reserve(estimate_tokens(prompt)):
+                if _cancelled.is_set():
+                    raise _LLMCancelledError("LLM call cancelled")
+                response = _get_http_session().post(endpoint, json=payload, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            return _extract_gemini_api_response(response.json())
+        except _requests.exceptions.Timeout:
+            system_logger.error(f"[LLMRunner/GeminiAPI] Воркер [id: {worker_id}] превысил лимит времени ({timeout}с).")
+            raise
+        except _requests.exceptions.ConnectionError as e:
+            system_logger.error(f"[LLMRunner/GeminiAPI] Воркер [id: {worker_id}] не может подключиться к Gemini API: {e}")
+            raise
+        except _requests.exceptions.HTTPError as e:
+            system_logger.error(f"[LLMRunner/GeminiAPI] Воркер [id: {worker_id}] для {label} HTTP-ошибка: {e}")
+            output_logger.error(f"[{worker_id}] --- FAILED OUTPUT FROM: {label} ---\n{e.response.text[:500]}\n")
+            raise
+
+    text = _execute()
+    output_logger.info(f"[{worker_id}] --- SUCCESSFUL OUTPUT FROM: {label} ---\n{text}\n")
+    return text
+
+
 def run_llm(
     backend: str,
     prompt: str,
@@ -451,7 +612,7 @@ def run_llm(
     """Dispatch an LLM call to the configured backend.
 
     Args:
-        backend: 'gemini', 'qwen', or 'ollama'.
+        backend: 'gemini', 'gemini_api', 'qwen', or 'ollama'.
         All other args passed through to the backend-specific runner.
 
     Returns:
@@ -472,6 +633,19 @@ def run_llm(
             ollama_url=ollama_url,
             ollama_options=ollama_options,
         )
+    if backend == "gemini_api":
+        return run_gemini_api(
+            prompt=prompt,
+            model_name=model_name,
+            output_format=output_format,
+            rate_limiter=rate_limiter,
+            timeout=timeout,
+            retry_attempts=retry_attempts,
+            retry_wait_min=retry_wait_min,
+            retry_wait_max=retry_wait_max,
+            worker_id=worker_id,
+            label=label,
+        )
     if backend == "qwen":
         return run_qwen(
             prompt=prompt,
@@ -525,6 +699,19 @@ def check_qwen_binary() -> None:
         )
 
 
+def check_gemini_api_key() -> None:
+    """Verify that a Gemini API key is set in the environment.
+
+    Raises:
+        RuntimeError: If neither GEMINI_API_KEY nor GOOGLE_API_KEY is set.
+    """
+    if _get_gemini_api_key() is None:
+        raise RuntimeError(
+            "Ключ Gemini API не найден. "
+            "Задайте переменную окружения GEMINI_API_KEY (https://aistudio.google.com/apikey)."
+        )
+
+
 def _normalize_ollama_model(name: str) -> str:
     """Normalize an Ollama model name: append ':latest' if no tag is specified."""
     return name if ':' in name else f"{name}:latest"
@@ -542,7 +729,7 @@ def check_ollama_connection(ollama_url: str, required_models: list[str]) -> None
     """
     tags_url = f"{ollama_url.rstrip('/')}/api/tags"
     try:
-        response = _requests.get(tags_url, timeout=5)
+        response = _get_http_session().get(tags_url, timeout=5)
         response.raise_for_status()
     except _requests.exceptions.ConnectionError:
         raise RuntimeError(
@@ -1,13 +1,16 @@
 import os
+import re
 import subprocess
 import json
+import itertools
 import uuid
+import threading
 import concurrent.futures
 from contextlib import contextmanager
 from datetime import datetime
 from dataclasses import dataclass, field, replace as dc_replace
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Callable, Protocol, runtime_checkable
 
 from book_translator.logger import setup_loggers, system_logger
 from book_translator.log_viewer import update_run_manifest
@@ -22,7 +25,7 @@ from book_translator import discovery
 from book_translator import path_resolver
 from book_translator import default_prompts
 from book_translator.rate_limiter import RateLimiter
-from book_translator.utils import parse_llm_json
+from book_translator.utils import json_dumps, parse_llm_json
 from book_translator.exceptions import TranslationLockedError, CancellationError
 from book_translator import llm_runner
 
@@ -161,6 +164,36 @@ def _reset_in_progress_to_failed(chunks_db: Path, chapter_name: str) -> None:
         db.batch_update_chunk_statuses(chunks_db, chapter_name, updates)
 
 
+def _glossary_json(glossary_db: Path, source_lang: str, target_lang: str) -> str:
+    """Serialise the glossary for prompt injection (compact JSON saves prompt tokens)."""
+    terms = db.get_terms(glossary_db, source_lang, target_lang)
+    return json_dumps([dict(t) for t in terms])
+
+
+def _previous_contexts(
+    chunks: list[dict[str, Any]],
+    content_key: str,
+    prompt_template: str,
+) -> dict[int, str]:
+    """Map each chunk_index to the previous chunk's text for {previous_context}.
+
+    Returns an empty mapping when the stage template does not use the
+    placeholder (e.g. a custom prompt override), so no context is carried.
+    """
+    if '{previous_context}' not in prompt_template:
+        return {}
+    return {
+        chunk['chunk_index']: chunks[i - 1][content_key] or ""
+        for i, chunk in enumerate(chunks) if i > 0
+    }
+
+
+def _set_chunk_statuses(chunks: list[dict[str, Any]], status: str) -> None:
+    """Mirror a successful promote_chapter_stage into the in-memory chunk list."""
+    for chunk in chunks:
+        chunk['status'] = status
+
+
 def _is_pid_alive(pid: int) -> bool:
     """Return True if process with given PID is still running."""
     try:
@@ -192,11 +225,135 @@ class WorkerConfig:
     backend: str = "gemini"
     ollama_url: str = "http://localhost:11434"
     ollama_options: dict = field(default_factory=dict)
+    batch_size: int = 1
+    max_workers: int = 50
+
+
+# ── Shared worker pool ───────────────────────────────────────────────────────
+# One ThreadPoolExecutor is reused by every stage of a run instead of spinning
+# up a fresh pool per stage. Reference-counted so that a finishing run (e.g. the
+# thread replaced on pause/resume) never shuts the pool down under a run that is
+# still using it.
+_executor: concurrent.futures.ThreadPoolExecutor | None = None
+_executor_size = 0
+_executor_users = 0
+_executor_lock = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> concurrent.futures.ThreadPoolExecutor:
+    """Return the shared worker pool, creating it on first use.
+
+    A pool that already exists is never resized: other runs may still be
+    using it. A differing max_workers is reported and the caller should
+    size its in-flight work by _executor_size instead.
+
+    Every call must be paired with _release_executor().
+    """
+    global _executor, _executor_size, _executor_users
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="bt-worker",
+            )
+            _executor_size = max_workers
+        elif max_workers != _executor_size:
+            system_logger.warning(
+                f"[Orchestrator] Пул воркеров уже запущен с размером {_executor_size}; "
+                f"max_concurrent = {max_workers} будет применён после его остановки."
+            )
+        _executor_users += 1
+        return _executor
+
+
+def _release_executor() -> None:
+    """Drop one reference to the shared pool; shut it down when unused."""
+    global _executor, _executor_size, _executor_users
+    with _executor_lock:
+        _executor_users = max(0, _executor_users - 1)
+        if _executor_users == 0 and _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+            _executor_size = 0
+
+
+# Rate limiters shared per series for the life of the process, so that quota
+# windows (notably the per-day one) carry over from chapter to chapter.
+_rate_limiters: dict[tuple, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def _get_rate_limiter(series_root: Path, workers_cfg: dict[str, Any]) -> RateLimiter:
+    """Return the process-wide RateLimiter for a series and its limits.
+
+    Changing any limit in the config yields a fresh limiter; quotas are not
+    persisted between processes.
+    """
+    key = (
+        str(series_root.resolve()),
+        workers_cfg['max_rps'],
+        workers_cfg.get('max_rpm', 0),
+        workers_cfg.get('max_tpm', 0),
+        workers_cfg.get('max_rpd', 0),
+    )
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                key[1],
+                max_rpm=key[2],
+                max_tpm=key[3],
+                max_rpd=key[4],
+                is_cancelled=llm_runner.is_cancelled,
+            )
+            _rate_limiters[key] = limiter
+        return limiter
+
+
+# Placeholders that change per chunk; everything else in a prompt template is
+# constant for a stage and is substituted once by _compile_prompt.
+_CHUNK_PLACEHOLDERS = ('{text}', '{previous_context}')
+_CHUNK_PLACEHOLDER_RE = re.compile('(' + '|'.join(re.escape(p) for p in _CHUNK_PLACEHOLDERS) + ')')
+
+# Literal fragments (even positions) interleaved with per-chunk placeholders (odd positions).
+CompiledPrompt = tuple[str, ...]
+
+
+def _compile_prompt(prompt_template: str, config: WorkerConfig) -> CompiledPrompt:
+    """Pre-render the stage-constant parts of a prompt template.
+
+    The template is split on the per-chunk placeholders first, so glossary or
+    style-guide text that happens to contain ``{text}`` is never substituted.
+    """
+    parts = _CHUNK_PLACEHOLDER_RE.split(prompt_template)
+    return tuple(
+        part if i % 2 else (part
+                            .replace('{glossary}', config.glossary_str)
+                            .replace('{style_guide}', config.style_guide_str)
+                            .replace('{world_info}', config.world_info_str)
+                            .replace('{typography_rules}', config.typography_rules_str)
+                            .replace('{target_lang_name}', config.target_lang_name)
+                            .replace('{source_lang_name}', config.source_lang_name))
+        for i, part in enumerate(parts)
+    )
+
+
+def _render_prompt(
+    prompt: CompiledPrompt | str,
+    text: str,
+    config: WorkerConfig,
+    previous_context: str = "",
+) -> str:
+    """Substitute chunk text and previous context into a compiled prompt."""
+    if isinstance(prompt, str):
+        prompt = _compile_prompt(prompt, config)
+    values = {'{text}': text, '{previous_context}': previous_context}
+    return ''.join(values[part] if i % 2 else part for i, part in enumerate(prompt))
 
 
 def _run_single_worker(
     chunk: dict[str, Any],
-    prompt_template: str,
+    prompt_template: CompiledPrompt | str,
     step_name: str,
     config: WorkerConfig,
     previous_context: str = "",
@@ -208,15 +365,7 @@ def _run_single_worker(
         db.update_chunk_status(config.chunks_db, config.chapter_name, chunk_index, f"{step_name}_in_progress")
 
         chunk_content = chunk['content_target'] if step_name == "reading" else chunk['content_source']
-        final_prompt = (prompt_template
-                        .replace('{text}', chunk_content)
-                        .replace('{glossary}', config.glossary_str)
-                        .replace('{style_guide}', config.style_guide_str)
-                        .replace('{previous_context}', previous_context)
-                        .replace('{world_info}', config.world_info_str)
-                        .replace('{typography_rules}', config.typography_rules_str)
-                        .replace('{target_lang_name}', config.target_lang_name)
-                        .replace('{source_lang_name}', config.source_lang_name))
+        final_prompt = _render_prompt(prompt_template, chunk_content, config, previous_context)
 
         stdout_output = llm_runner.run_llm(
             backend=config.backend,
@@ -257,11 +406,16 @@ def _run_single_worker(
 
         system_logger.info(f"[Orchestrator] Воркер [id: {worker_id}] для chunk_{chunk_index} успешно завершен.")
 
+        # Mirror successful writes into the caller's chunk dict so the
+        # orchestrator does not have to re-read the chapter between stages.
         if step_name == "discovery":
             db.update_chunk_status(config.chunks_db, config.chapter_name, chunk_index, "discovery_done")
+            chunk['status'] = "discovery_done"
         elif step_name in ("translation", "reading"):
             status = "translation_done" if step_name == "translation" else "reading_done"
             db.update_chunk_content(config.chunks_db, config.chapter_name, chunk_index, stdout_output, status)
+            chunk['content_target'] = stdout_output
+            chunk['status'] = status
 
         return True
 
@@ -274,6 +428,310 @@ def _run_single_worker(
         return False
 
 
+# Appended to the stage prompt when several chunks are sent in one LLM call.
+_BATCH_OUTPUT_INSTRUCTION = """
+
+<batch_output_format>
+This block REPLACES every output format or output instruction given above, including any request
+to return raw text only. Follow it instead.
+The source text contains several fragments, each delimited by `### CHUNK <n>` and `### END`.
+Process every fragment independently according to the instructions above and return ONLY a JSON array
+with one object per fragment: [{"chunk_index": <n>, "output": <result for this fragment>}]
+`output` is {output_value}. No markdown, no explanation.
+</batch_output_format>
+"""
+
+_BATCH_OUTPUT_VALUES = {
+    "discovery": "a JSON array of term objects in the format described above ([] if the fragment has no new terms), never a string",
+    "translation": "a JSON string holding the full translation of that fragment",
+    "reading": "a JSON string holding the full polished text of that fragment",
+}
+
+# Raw-text output instructions of the translation/proofreading templates; they
+# contradict the JSON envelope, so batch prompts drop them.
+_OUTPUT_INSTRUCTION_RE = re.compile(r'\n?<output_instruction>.*?</output_instruction>\n?', re.DOTALL)
+
+
+def _batch_prompt_template(prompt_template: str, step_name: str) -> str:
+    """Return the batch variant of a stage template (raw-text instruction swapped for the JSON envelope)."""
+    instruction = _BATCH_OUTPUT_INSTRUCTION.replace('{output_value}', _BATCH_OUTPUT_VALUES[step_name])
+    return _OUTPUT_INSTRUCTION_RE.sub('\n', prompt_template).rstrip() + instruction
+
+
+def _batch_output(step_name: str, value: Any) -> Any:
+    """Validate one fragment's ``output`` from a batched response.
+
+    Returns the value to store, or None if the chunk must be redone on its own:
+    discovery needs a term list (a JSON-encoded list string is decoded), the
+    text stages need a non-empty string.
+    """
+    if step_name == "discovery":
+        if isinstance(value, str):
+            try:
+                value = parse_llm_json(value)
+            except ValueError:
+                return None
+        return value if isinstance(value, list) else None
+    if isinstance(value, str) and value.strip():
+        return value
+    return None
+
+
+def _run_batched_worker(
+    batch: list[dict[str, Any]],
+    prompt_template: CompiledPrompt | str,
+    step_name: str,
+    config: WorkerConfig,
+    contexts: dict[int, str],
+    batch_prompt: CompiledPrompt | str,
+) -> list[bool]:
+    """Process several consecutive chunks with a single LLM call.
+
+    The chunks are concatenated into ``{text}`` of ``batch_prompt`` (see
+    _batch_prompt_template) as ``### CHUNK n`` blocks and the model returns
+    ``[{chunk_index, output}, ...]``. If the response cannot be parsed or
+    misses a chunk, the batch falls back to per-chunk calls with the regular
+    ``prompt_template``.
+
+    Returns:
+        One success flag per chunk, in batch order.
+    """
+    worker_id = uuid.uuid4().hex[:6]
+    indices = [c['chunk_index'] for c in batch]
+    label = f"chunks_{indices[0]}-{indices[-1]}"
+
+    db.batch_update_chunk_statuses(
+        config.chunks_db, config.chapter_name, [(i, f"{step_name}_in_progress") for i in indices],
+    )
+
+    content_key = 'content_target' if step_name == "reading" else 'content_source'
+    batch_text = "\n".join(f"### CHUNK {c['chunk_index']}\n{c[content_key]}\n### END" for c in batch)
+    final_prompt = _render_prompt(batch_prompt, batch_text, config, contexts.get(indices[0], ""))
+
+    outputs: dict[int, Any] = {}
+    try:
+        stdout_output = llm_runner.run_llm(
+            backend=config.backend,
+            prompt=final_prompt,
+            model_name=config.model_name,
+            output_format="json",
+            rate_limiter=config.rate_limiter,
+            timeout=config.worker_timeout * len(batch),
+            retry_attempts=config.retry_attempts,
+            retry_wait_min=config.retry_wait_min,
+            retry_wait_max=config.retry_wait_max,
+            worker_id=worker_id,
+            label=label,
+            ollama_url=config.ollama_url,
+            ollama_options=config.ollama_options,
+        )
+        items = parse_llm_json(stdout_output or "")
+        if isinstance(items, list):
+            for item in items:
+                # Discovery legitimately answers [] for a fragment without new
+                # terms, so an empty output is fine as long as its type is right.
+                if isinstance(item, dict) and 'chunk_index' in item and 'output' in item:
+                    value = _batch_output(step_name, item['output'])
+                    if value is None:
+                        continue
+                    try:
+                        outputs[int(item['chunk_index'])] = value
+                    except (TypeError, ValueError):
+                        continue
+    except CancellationError:
+        raise
+    except Exception as e:
+        system_logger.error(f"[Orchestrator] Пакетный воркер [id: {worker_id}] для {label} завершился с ошибкой: {e}")
+
+    missing = [i for i in indices if i not in outputs]
+    if missing:
+        system_logger.warning(
+            f"[Orchestrator] Пакетный ответ [id: {worker_id}] для {label} неполон "
+            f"(нет чанков: {missing}). Переход к поштучной обработке."
+        )
+        return [
+            _run_single_worker(c, prompt_template, step_name, config, contexts.get(c['chunk_index'], ""))
+            for c in batch
+        ]
+
+    if step_name == "discovery":
+        safe_chapter = _safe_chapter_name(config.chapter_name)
+        for i in indices:
+            output_path = config.volume_paths.cache_dir / f"{safe_chapter}_chunk_{i}.json"
+            output_path.write_text(json_dumps(outputs[i]), encoding='utf-8')
+        db.batch_update_chunk_statuses(
+            config.chunks_db, config.chapter_name, [(i, "discovery_done") for i in indices],
+        )
+        for c in batch:
+            c['status'] = "discovery_done"
+    else:
+        status = "translation_done" if step_name == "translation" else "reading_done"
+        db.batch_update_chunks_content(
+            config.chunks_db,
+            config.chapter_name,
+            [{'chunk_index': i, 'content_target': outputs[i], 'status': status} for i in indices],
+        )
+        for c in batch:
+            c['content_target'] = outputs[c['chunk_index']]
+            c['status'] = status
+    system_logger.info(f"[Orchestrator] Пакетный воркер [id: {worker_id}] для {label} успешно завершен.")
+    return [True] * len(batch)
+
+
+def _run_combined_worker(
+    chunk: dict[str, Any],
+    prompt_template: CompiledPrompt | str,
+    step_name: str,
+    config: WorkerConfig,
+    previous_context: str = "",
+) -> bool:
+    """Run discovery, translation and proofreading for a chunk in one LLM call.
+
+    Used when `workers.fused_pipeline` is enabled. The response must be a JSON
+    object ``{terms, translation, proofread}``: the terms are cached like a
+    regular discovery response (so term approval works unchanged) and the
+    proofread text becomes the chunk's content_target with status reading_done.
+    Failures are recorded as ``{step_name}_failed`` so --resume can retry them.
+    """
+    worker_id = uuid.uuid4().hex[:6]
+    chunk_index = chunk['chunk_index']
+
+    try:
+        db.update_chunk_status(config.chunks_db, config.chapter_name, chunk_index, f"{step_name}_in_progress")
+
+        final_prompt = _render_prompt(prompt_template, chunk['content_source'], config, previous_context)
+        stdout_output = llm_runner.run_llm(
+            backend=config.backend,
+            prompt=final_prompt,
+            model_name=config.model_name,
+            output_format="json",
+            rate_limiter=config.rate_limiter,
+            timeout=config.worker_timeout,
+            retry_attempts=config.retry_attempts,
+            retry_wait_min=config.retry_wait_min,
+            retry_wait_max=config.retry_wait_max,
+            worker_id=worker_id,
+            label=f"chunk_{chunk_index}",
+            ollama_url=config.ollama_url,
+            ollama_options=config.ollama_options,
+        )
+
+        try:
+            result = parse_llm_json(stdout_output or "")
+        except ValueError as e:
+            system_logger.error(f"[Orchestrator] Воркер [id: {worker_id}] для chunk_{chunk_index} вернул невалидный JSON: {e}")
+            db.update_chunk_status(config.chunks_db, config.chapter_name, chunk_index, f"{step_name}_failed")
+            return False
+
+        proofread = (result.get('proofread') or result.get('translation')) if isinstance(result, dict) else None
+        if not isinstance(proofread, str) or not proofread.strip():
+            system_logger.error(
+                f"[Orchestrator] Воркер [id: {worker_id}] для chunk_{chunk_index} не вернул перевод "
+                "в полях 'proofread'/'translation'."
+            )
+            db.update_chunk_status(config.chunks_db, config.chapter_name, chunk_index, f"{step_name}_failed")
+            return False
+
+        terms = result.get('terms')
+        output_path = config.volume_paths.cache_dir / f"{_safe_chapter_name(config.chapter_name)}_chunk_{chunk_index}.json"
+        output_path.write_text(
+            json_dumps(terms if isinstance(terms, list) else []),
+            encoding='utf-8',
+        )
+
+        db.update_chunk_content(config.chunks_db, config.chapter_name, chunk_index, proofread.strip(), "reading_done")
+        chunk['content_target'] = proofread.strip()
+        chunk['status'] = "reading_done"
+        system_logger.info(f"[Orchestrator] Воркер [id: {worker_id}] для chunk_{chunk_index} успешно завершен (единый проход).")
+        return True
+
+    except CancellationError:
+        raise
+    except Exception as e:
+        system_logger.critical(f"[Orchestrator] КРИТИЧЕСКАЯ ОШИБКА при запуске воркера [id: {worker_id}] для chunk_{chunk_index}: {e}", exc_info=True)
+        db.update_chunk_status(config.chunks_db, config.chapter_name, chunk_index, f"{step_name}_failed")
+        return False
+
+
+# Chunks shared by neighbouring global-proofreading windows, so that
+# consistency issues at a window boundary are seen from both sides.
+_GLOBAL_WINDOW_OVERLAP = 2
+
+
+def _split_into_windows(
+    chunks: list[dict[str, Any]],
+    window_size: int,
+    overlap: int = _GLOBAL_WINDOW_OVERLAP,
+) -> list[list[dict[str, Any]]]:
+    """Split chunks into overlapping windows for global proofreading.
+
+    A window_size of 0 (or a chapter that fits in one window) yields a single
+    window with every chunk.
+    """
+    if window_size <= 0 or len(chunks) <= window_size:
+        return [chunks]
+    step = max(1, window_size - min(overlap, window_size // 4))
+    windows = []
+    for start in range(0, len(chunks), step):
+        windows.append(chunks[start:start + window_size])
+        if start + window_size >= len(chunks):
+            break
+    return windows
+
+
+def _run_global_proofreading_window(
+    window: list[dict[str, Any]],
+    prompt_template: str,
+    model_name: str,
+    rate_limiter: RateLimiter,
+    proofreading_timeout: int,
+    retry_attempts: int,
+    retry_wait_min: int,
+    retry_wait_max: int,
+    worker_id: str,
+    label: str,
+    backend: str,
+    ollama_url: str,
+    ollama_options: dict | None,
+) -> list[dict]:
+    """Request global-proofreading diffs for one window of chunks.
+
+    Raises:
+        ValueError: If the response is not a JSON list of diffs.
+        subprocess.CalledProcessError, subprocess.TimeoutExpired: From the LLM backend.
+    """
+    chunks_text = "\n".join(
+        f"Chunk {chunk['chunk_index']}:\ncontent_source: {chunk['content_source']}\ncontent_target: {chunk['content_target']}\n"
+        for chunk in window
+    )
+    stdout = llm_runner.run_llm(
+        backend=backend,
+        prompt=prompt_template + "\n\n" + chunks_text,
+        model_name=model_name,
+        output_format='json',
+        rate_limiter=rate_limiter,
+        timeout=proofreading_timeout,
+        retry_attempts=retry_attempts,
+        retry_wait_min=retry_wait_min,
+        retry_wait_max=retry_wait_max,
+        worker_id=worker_id,
+        label=label,
+        ollama_url=ollama_url,
+        ollama_options=ollama_options,
+    )
+
+    diffs = parse_llm_json(stdout.strip())
+    if not isinstance(diffs, list):
+        raise ValueError(f"глобальная вычитка вернула не список: {stdout[:200]}")
+
+    # Unwrap [[{...}]] → [{...}]: json_repair sometimes wraps a list in another list
+    # when the model includes extra text around the JSON.
+    if diffs and isinstance(diffs[0], list):
+        diffs = [item for sublist in diffs for item in sublist if isinstance(item, dict)]
+        system_logger.warning(f"[Orchestrator] Глобальная вычитка ({label}) вернула вложенный список — выполнена распаковка.")
+    return diffs
+
+
 def _run_global_proofreading(
     chunks: list[dict[str, Any]],
     prompt_template: str,
@@ -290,49 +748,66 @@ def _run_global_proofreading(
     backend: str = "gemini",
     ollama_url: str = "http://localhost:11434",
     ollama_options: dict | None = None,
+    window_size: int = 0,
+    executor: concurrent.futures.Executor | None = None,
 ) -> tuple[list[dict[str, Any]], bool]:
-    system_logger.info("[Orchestrator] Запуск глобальной вычитки...")
+    """Run the chapter-wide proofreading pass and apply its diffs.
 
-    # Format chunks for the prompt
-    formatted_chunks = []
-    for chunk in chunks:
-        formatted_chunks.append(f"Chunk {chunk['chunk_index']}:\ncontent_source: {chunk['content_source']}\ncontent_target: {chunk['content_target']}\n")
+    Long chapters are split into overlapping windows of ``window_size`` chunks
+    (see _split_into_windows) that are proofread in parallel on ``executor``;
+    the progress handle advances once per window. The pass is all-or-nothing:
+    if any window fails, no diffs are applied.
 
-    chunks_text = "\n".join(formatted_chunks)
-    final_prompt = (prompt_template
-                    .replace('{glossary}', glossary_str)
-                    .replace('{style_guide}', style_guide_str)
-                    .replace('{target_lang_name}', target_lang_name)
-                    + "\n\n" + chunks_text)
+    Returns:
+        (updated_chunks, success)
+    """
+    system_logger.info("[Orchestrator] Запуск глобальной вычитки...")
 
-    try:
-        stdout = llm_runner.run_llm(
-            backend=backend,
-            prompt=final_prompt,
-            model_name=model_name,
-            output_format='json',
-            rate_limiter=rate_limiter,
-            timeout=proofreading_timeout,
-            retry_attempts=retry_attempts,
-            retry_wait_min=retry_wait_min,
-            retry_wait_max=retry_wait_max,
-            worker_id='global',
-            label='global_proofreading',
-            ollama_url=ollama_url,
-            ollama_options=ollama_options,
+    base_prompt = (prompt_template
+                   .replace('{glossary}', glossary_str)
+                   .replace('{style_guide}', style_guide_str)
+                   .replace('{target_lang_name}', target_lang_name))
+    windows = _split_into_windows(chunks, window_size)
+    single = len(windows) == 1
+
+    def _window_args(n: int, window: list[dict[str, Any]]) -> tuple:
+        return (
+            window, base_prompt, model_name, rate_limiter, proofreading_timeout,
+            retry_attempts, retry_wait_min, retry_wait_max,
+            'global' if single else f'global_{n}',
+            'global_proofreading' if single else
+            f"global_proofreading_{window[0]['chunk_index']}-{window[-1]['chunk_index']}",
+            backend, ollama_url, ollama_options,
         )
 
-        diffs = parse_llm_json(stdout.strip())
-
-        if not isinstance(diffs, list):
-            system_logger.warning(f"[Orchestrator] Глобальная вычитка вернула не список. Пропуск. Ответ: {stdout[:200]}")
-            return chunks, False
+    futures: list[concurrent.futures.Future] = []
+    if single or executor is None:
+        results = (_run_global_proofreading_window(*_window_args(n, w)) for n, w in enumerate(windows, 1))
+    else:
+        system_logger.info(f"[Orchestrator] Глобальная вычитка разбита на окна, параллельных запросов: {len(windows)}.")
+        futures = [
+            executor.submit(_run_global_proofreading_window, *_window_args(n, w))
+            for n, w in enumerate(windows, 1)
+        ]
+        # Merge in window order, not completion order: overlapping windows can
+        # propose different edits to the same chunk, and the first window must
+        # win on every run for the result to be reproducible.
+        results = (future.result() for future in futures)
 
-        # Unwrap [[{...}]] → [{...}]: json_repair sometimes wraps a list in another list
-        # when the model includes extra text around the JSON.
-        if diffs and isinstance(diffs[0], list):
-            diffs = [item for sublist in diffs for item in sublist if isinstance(item, dict)]
-            system_logger.warning("[Orchestrator] Глобальная вычитка вернула вложенный список — выполнена распаковка.")
+    try:
+        diffs: list = []
+        seen: set[tuple[Any, Any]] = set()
+        for window_diffs in results:
+            for diff in window_diffs:
+                # Overlapping windows may propose the same edit twice.
+                key = (diff.get('chunk_index'), diff.get('find')) if isinstance(diff, dict) else None
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                diffs.append(diff)
+            if progress_handle is not None:
+                progress_handle.advance(1)
 
         system_logger.info(f"[Orchestrator] Получено {len(diffs)} правок от глобальной вычитки.")
         updated_chunks, applied, skipped = proofreader.apply_diffs(chunks, diffs)
@@ -340,11 +815,10 @@ def _run_global_proofreading(
         if skipped > 0:
             system_logger.warning(f"[Orchestrator] {skipped} правок не применено — текст изменился или совпадений нет.")
 
-        if progress_handle is not None:
-            progress_handle.advance(1)
-
         return updated_chunks, True
 
+    except CancellationError:
+        raise
     except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
         system_logger.error(f"[Orchestrator] Ошибка глобальной вычитки: {e}")
         return chunks, False
@@ -354,17 +828,26 @@ def _run_global_proofreading(
     except Exception as e:
         system_logger.critical(f"[Orchestrator] Неожиданная ошибка при глобальной вычитке: {e}", exc_info=True)
         return chunks, False
+    finally:
+        for future in futures:
+            future.cancel()
+        concurrent.futures.wait(futures)
 
 
 def _run_workers_pooled(
-    max_workers: int,
+    executor: concurrent.futures.Executor,
     chunks: list[dict[str, Any]],
     prompt_template: str,
     step_name: str,
     config: WorkerConfig,
     contexts: dict[int, str] | None = None,
     ui: TranslationUI | None = None,
+    worker: Callable[..., bool] = _run_single_worker,
 ):
+    if not chunks:
+        # Nothing pending (e.g. a resumed stage that already finished):
+        # don't open a progress bar or touch the pool.
+        return True
     if ui is None:
         ui = _NullInteractions()
     all_successful = True
@@ -372,34 +855,59 @@ def _run_workers_pooled(
     completed_tasks_count = 0
     contexts = contexts or {}
 
+    # Substitute glossary, style guide etc. once per stage, not once per chunk.
+    raw_template = prompt_template
+    prompt_template = _compile_prompt(raw_template, config)
+
+    if config.batch_size > 1 and worker is _run_single_worker:
+        batch_prompt = _compile_prompt(_batch_prompt_template(raw_template, step_name), config)
+        tasks = (
+            (_run_batched_worker, (batch, prompt_template, step_name, config, contexts, batch_prompt), batch)
+            for batch in (chunks[i:i + config.batch_size] for i in range(0, total_tasks, config.batch_size))
+        )
+    else:
+        tasks = (
+            (worker, (chunk, prompt_template, step_name, config, contexts.get(chunk['chunk_index'], "")), [chunk])
+            for chunk in chunks
+        )
+    # Keep only a bounded window of futures queued (enough to keep every
+    # worker busy) instead of one per chunk, topping it up as tasks finish.
+    max_pending = max(1, config.max_workers * 2)
+
+    def _submit_next(pending: dict) -> None:
+        for fn, args, batch in itertools.islice(tasks, max_pending - len(pending)):
+            pending[executor.submit(fn, *args)] = batch
+
     with ui.progress(step_name, total_tasks) as handle:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    _run_single_worker,
-                    chunk,
-                    prompt_template,
-                    step_name,
-                    config,
-                    contexts.get(chunk['chunk_index'], ""),
-                ): chunk for chunk in chunks
-            }
-
-            for future in concurrent.futures.as_completed(futures):
-                chunk = futures[future]
-                try:
-                    success = future.result()
-                    if success:
-                        completed_tasks_count += 1
-                        handle.advance(1)
-                        system_logger.info(f"[Orchestrator] Прогресс: ({completed_tasks_count}/{total_tasks})")
-                    else:
+        futures: dict[concurrent.futures.Future, list[dict[str, Any]]] = {}
+        try:
+            _submit_next(futures)
+            while futures:
+                done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    batch = futures.pop(future)
+                    try:
+                        result = future.result()
+                        results = result if isinstance(result, list) else [result]
+                        succeeded = sum(1 for ok in results if ok)
+                        if succeeded:
+                            completed_tasks_count += succeeded
+                            handle.advance(succeeded)
+                            system_logger.info(f"[Orchestrator] Прогресс: ({completed_tasks_count}/{total_tasks})")
+                        if succeeded < len(results):
+                            all_successful = False
+                    except CancellationError:
+                        raise  # не перехватывать — пользователь отменил/поставил на паузу
+                    except Exception as e:
+                        system_logger.critical(f"[Orchestrator] Неожиданная ошибка при обработке chunk_{batch[0]['chunk_index']}: {e}", exc_info=True)
                         all_successful = False
-                except CancellationError:
-                    raise  # не перехватывать — пользователь отменил/поставил на паузу
-                except Exception as e:
-                    system_logger.critical(f"[Orchestrator] Неожиданная ошибка при обработке chunk_{chunk['chunk_index']}: {e}", exc_info=True)
-                    all_successful = False
+                _submit_next(futures)
+        finally:
+            # The pool outlives this stage: drop queued work and wait for the
+            # in-flight workers so no stage leaks tasks into the next one.
+            for future in futures:
+                future.cancel()
+            concurrent.futures.wait(futures)
 
     return all_successful
 
@@ -435,6 +943,13 @@ def run_translation_process(
     llm_runner.reset_cancellation()
     cfg = discovery.load_series_config(series_root)
     max_workers = cfg.get('workers', {}).get('max_concurrent', 50)
+    fused_pipeline = cfg.get('workers', {}).get('fused_pipeline', False)
+    batch_size = cfg.get('workers', {}).get('batch_size', 1)
+    if fused_pipeline and batch_size > 1:
+        # The fused pass sends one chunk per request and replaces every stage
+        # that batching applies to.
+        system_logger.info("[Orchestrator] batch_size игнорируется при fused_pipeline = true.")
+        batch_size = 1
     worker_timeout = cfg.get('llm', {}).get('worker_timeout_seconds', 120)
     proofreading_timeout = cfg.get('llm', {}).get('proofreading_timeout_seconds', 300)
     retry_attempts = cfg.get('retry', {}).get('max_attempts', 3)
@@ -495,10 +1010,11 @@ def run_translation_process(
     glossary_db = series_root / 'glossary.db'
     chunks_db = volume_paths.chunks_db
     db.init_chunks_db(chunks_db)
-    rate_limiter = RateLimiter(cfg['workers']['max_rps'])
+    rate_limiter = _get_rate_limiter(series_root, cfg['workers'])
 
     lock_file = _chapter_lock_path(volume_paths, chapter_name)
     lock_payload: dict[str, Any] | None = None
+    executor: concurrent.futures.ThreadPoolExecutor | None = None
 
     if force and volume_paths.state_dir.exists():
         system_logger.info(f"[Orchestrator] Обнаружен флаг `--force`. Очистка состояния главы '{chapter_name}'...")
@@ -508,6 +1024,8 @@ def run_translation_process(
 
     # Load prompts (backend-aware: ollama uses simplified prompts unless user overrides)
     term_prompt_template = path_resolver.resolve_prompt(series_root, 'term_discovery', default_prompts.PROMPTS, backend, default_prompts.LOCAL_PROMPTS)
+    if fused_pipeline:
+        fused_prompt_template = path_resolver.resolve_prompt(series_root, 'fused_pipeline', default_prompts.PROMPTS, backend, default_prompts.LOCAL_PROMPTS)
     translation_prompt_template = path_resolver.resolve_prompt(series_root, 'translation', default_prompts.PROMPTS, backend, default_prompts.LOCAL_PROMPTS)
     proofreading_prompt_template = path_resolver.resolve_prompt(series_root, 'proofreading', default_prompts.PROMPTS, backend, default_prompts.LOCAL_PROMPTS)
     global_proofreading_prompt_template = path_resolver.resolve_prompt(series_root, 'global_proofreading', default_prompts.PROMPTS, backend, default_prompts.LOCAL_PROMPTS)
@@ -535,6 +1053,8 @@ def run_translation_process(
         backend=backend,
         ollama_url=ollama_url,
         ollama_options=ollama_options,
+        batch_size=batch_size,
+        max_workers=max_workers,
     )
 
     # Validate backend connectivity before starting the pipeline
@@ -545,6 +1065,8 @@ def run_translation_process(
         llm_runner.check_qwen_binary()
     elif backend == 'gemini':
         llm_runner.check_gemini_binary()
+    elif backend == 'gemini_api':
+        llm_runner.check_gemini_api_key()
 
     # Handle restart_stage: reset pipeline to the requested stage
     if restart_stage and restart_stage in _STAGE_PENDING_STATUS:
@@ -562,6 +1084,8 @@ def run_translation_process(
             f"  Модели: discovery={discovery_model}, translation={translation_model}, "
             f"proofreading={proofreading_model}, global={global_proofreading_model}\n"
             f"  Воркеров: {max_workers}\n"
+            f"  Единый проход: {'да' if fused_pipeline else 'нет'}\n"
+            f"  Чанков на запрос: {batch_size}\n"
             f"  Таймаут воркера: {worker_timeout}с\n"
             f"  Таймаут вычитки: {proofreading_timeout}с\n"
             f"  Retry: {retry_attempts} попытки, {retry_wait_min}-{retry_wait_max}с\n"
@@ -581,6 +1105,9 @@ def run_translation_process(
     try:
         lock_payload = _acquire_chapter_lock(lock_file, chapter_name, force)
         system_logger.info(f"[Orchestrator] Рабочая директория для главы '{chapter_name}' заблокирована.")
+        executor = _get_executor(max_workers)
+        if _executor_size != max_workers:
+            base_config = dc_replace(base_config, max_workers=_executor_size)
 
         if resume:
             # Atomically reset all stalled/failed chunks back to their pending state.
@@ -593,9 +1120,17 @@ def run_translation_process(
                     resume_updates.append((chunk['chunk_index'], new_status))
             if resume_updates:
                 db.batch_update_chunk_statuses(chunks_db, chapter_name, resume_updates)
+                new_statuses = dict(resume_updates)
+                for chunk in chunks:
+                    chunk['status'] = new_statuses.get(chunk['chunk_index'], chunk['status'])
+        else:
+            chunks = db.get_chunks(chunks_db, chapter_name)
 
         # --- Этап 0: Разделение на чанки ---
-        chunks = db.get_chunks(chunks_db, chapter_name)
+        # `chunks` is the in-memory view of the chapter for the whole run:
+        # workers update their chunk dicts after each DB write and stage
+        # promotions are mirrored via _set_chunk_statuses, so the chapter is
+        # read from the DB only here.
         if not chunks:
             if db.get_chapter_stage(chunks_db, chapter_name) is not None:
                 system_logger.warning(
@@ -610,10 +1145,17 @@ def run_translation_process(
                 cfg['splitter']['max_part_chars'],
                 cfg['splitter']['min_chunk_size'],
             )
-            for chunk_data in chunks_data:
-                db.add_chunk(chunks_db, chapter_name, chunk_data['id'], content_source=chunk_data['text'], status="discovery_pending")
+            db.batch_add_chunks(
+                chunks_db, chapter_name,
+                [(chunk_data['id'], chunk_data['text']) for chunk_data in chunks_data],
+                status="discovery_pending",
+            )
             chunks = db.get_chunks(chunks_db, chapter_name)
 
+        # Serialised once and reused by every stage; refreshed only after term
+        # approval, the one step that changes the glossary during a run.
+        glossary_content = _glossary_json(glossary_db, source_lang, target_lang)
+
         # --- Этап 1: Поиск терминов ---
         stage = db.get_chapter_stage(chunks_db, chapter_name)
         if stage not in ('translation', 'proofreading', 'global_proofreading', 'complete'):
@@ -621,16 +1163,26 @@ def run_translation_process(
             _update_manifest(current_stage=current_stage, status="running")
             system_logger.info("\n--- ЭТАП 1: Поиск новых терминов ---")
             _cleanup_chapter_artifacts(volume_paths, chapter_name)
-            terms = db.get_terms(glossary_db, source_lang, target_lang)
-            glossary_content = json.dumps([dict(t) for t in terms], ensure_ascii=False, indent=2)
 
-            pending_chunks = [c for c in db.get_chunks(chunks_db, chapter_name) if c['status'] == 'discovery_pending']
+            all_chunks = chunks
+            pending_chunks = [c for c in all_chunks if c['status'] == 'discovery_pending']
             if pending_chunks:
-                discovery_config = dc_replace(base_config, output_format="json", glossary_str=glossary_content, model_name=discovery_model, ollama_options=_stage_options(ollama_options, 'discovery'))
-                success = _run_workers_pooled(
-                    max_workers, pending_chunks, term_prompt_template, "discovery",
-                    discovery_config, ui=ui,
-                )
+                if fused_pipeline:
+                    # Single pass per chunk: terms + translation + proofreading.
+                    # Terms discovered here are approved afterwards, so they only
+                    # influence later chapters and the global proofreading pass.
+                    contexts = _previous_contexts(all_chunks, 'content_source', fused_prompt_template)
+                    fused_config = dc_replace(base_config, output_format="json", glossary_str=glossary_content, model_name=translation_model, ollama_options=_stage_options(ollama_options, 'translation'))
+                    success = _run_workers_pooled(
+                        executor, pending_chunks, fused_prompt_template, "discovery",
+                        fused_config, contexts=contexts, ui=ui, worker=_run_combined_worker,
+                    )
+                else:
+                    discovery_config = dc_replace(base_config, output_format="json", glossary_str=glossary_content, model_name=discovery_model, ollama_options=_stage_options(ollama_options, 'discovery'))
+                    success = _run_workers_pooled(
+                        executor, pending_chunks, term_prompt_template, "discovery",
+                        discovery_config, ui=ui,
+                    )
                 if not success:
                     _reset_in_progress_to_failed(chunks_db, chapter_name)
                     system_logger.error("[Orchestrator] Этап поиска терминов завершился с ошибками.")
@@ -640,25 +1192,40 @@ def run_translation_process(
                     return False
 
             system_logger.info("\n--- Сбор и подтверждение терминов ---")
-            raw_responses = []
             safe_chapter = _safe_chapter_name(chapter_name)
-            for json_file in sorted(volume_paths.cache_dir.glob(f"{safe_chapter}_chunk_*.json")):
-                raw_responses.append(json_file.read_text(encoding='utf-8'))
+            # Overlap the per-file open/read latency on the already running pool;
+            # map() keeps the sorted file order.
+            raw_responses = list(executor.map(
+                lambda json_file: json_file.read_text(encoding='utf-8'),
+                sorted(volume_paths.cache_dir.glob(f"{safe_chapter}_chunk_*.json")),
+            ))
 
             new_terms = term_collector.collect_terms_from_responses(raw_responses)
             if new_terms:
                 tsv_path = volume_paths.state_dir / f'pending_terms_{safe_chapter}.tsv'
                 ui.approve_terms(new_terms, tsv_path, glossary_db, source_lang, target_lang)
+                glossary_content = _glossary_json(glossary_db, source_lang, target_lang)
             else:
                 system_logger.info("[TermCollector] Новых терминов для добавления не найдено.")
 
-            db.promote_chapter_stage(
-                chunks_db,
-                chapter_name,
-                'translation',
-                expected_statuses={'discovery_done'},
-                status_mapping={'discovery_done': 'translation_pending'},
-            )
+            if fused_pipeline:
+                # Chunks are already translated and proofread — skip straight
+                # to the chapter-wide proofreading pass.
+                db.promote_chapter_stage(
+                    chunks_db,
+                    chapter_name,
+                    'global_proofreading',
+                    expected_statuses={'reading_done'},
+                )
+            else:
+                db.promote_chapter_stage(
+                    chunks_db,
+                    chapter_name,
+                    'translation',
+                    expected_statuses={'discovery_done'},
+                    status_mapping={'discovery_done': 'translation_pending'},
+                )
+                _set_chunk_statuses(chunks, 'translation_pending')
             system_logger.info("[Orchestrator] Этап discovery завершён.")
         else:
             system_logger.info("\n[Orchestrator] Обнаружен чекпоинт. Пропуск этапа поиска терминов.")
@@ -669,21 +1236,16 @@ def run_translation_process(
             current_stage = "translation"
             _update_manifest(current_stage=current_stage, status="running")
             system_logger.info("\n--- ЭТАП 2: Перевод чанков ---")
-            terms = db.get_terms(glossary_db, source_lang, target_lang)
-            glossary_content = json.dumps([dict(t) for t in terms], ensure_ascii=False, indent=2)
 
-            all_chunks = db.get_chunks(chunks_db, chapter_name)
+            all_chunks = chunks
             pending_chunks = [c for c in all_chunks if c['status'] == 'translation_pending']
 
-            contexts = {}
-            for i, chunk in enumerate(all_chunks):
-                if i > 0:
-                    contexts[chunk['chunk_index']] = all_chunks[i-1]['content_source']
+            contexts = _previous_contexts(all_chunks, 'content_source', translation_prompt_template)
 
             if pending_chunks:
                 translation_config = dc_replace(base_config, glossary_str=glossary_content, model_name=translation_model, ollama_options=_stage_options(ollama_options, 'translation'))
                 success = _run_workers_pooled(
-                    max_workers, pending_chunks, translation_prompt_template, "translation",
+                    executor, pending_chunks, translation_prompt_template, "translation",
                     translation_config, contexts=contexts, ui=ui,
                 )
                 if not success:
@@ -701,6 +1263,7 @@ def run_translation_process(
                 expected_statuses={'translation_done'},
                 status_mapping={'translation_done': 'reading_pending'},
             )
+            _set_chunk_statuses(chunks, 'reading_pending')
             system_logger.info("[Orchestrator] Этап translation завершён.")
         else:
             system_logger.info("\n[Orchestrator] Обнаружен чекпоинт. Пропуск этапа перевода.")
@@ -711,21 +1274,16 @@ def run_translation_process(
             current_stage = "proofreading"
             _update_manifest(current_stage=current_stage, status="running")
             system_logger.info("\n--- ЭТАП 3: Вычитка текста ---")
-            terms = db.get_terms(glossary_db, source_lang, target_lang)
-            glossary_content = json.dumps([dict(t) for t in terms], ensure_ascii=False, indent=2)
 
-            all_chunks = db.get_chunks(chunks_db, chapter_name)
+            all_chunks = chunks
             pending_chunks = [c for c in all_chunks if c['status'] == 'reading_pending']
 
-            contexts = {}
-            for i, chunk in enumerate(all_chunks):
-                if i > 0:
-                    contexts[chunk['chunk_index']] = all_chunks[i-1]['content_target'] or ""
+            contexts = _previous_contexts(all_chunks, 'content_target', proofreading_prompt_template)
 
             if pending_chunks:
                 proofreading_config = dc_replace(base_config, glossary_str=glossary_content, model_name=proofreading_model, ollama_options=_stage_options(ollama_options, 'proofreading'))
                 success = _run_workers_pooled(
-                    max_workers, pending_chunks, proofreading_prompt_template, "reading",
+                    executor, pending_chunks, proofreading_prompt_template, "reading",
                     proofreading_config, contexts=contexts, ui=ui,
                 )
                 if not success:
@@ -753,13 +1311,10 @@ def run_translation_process(
             _update_manifest(current_stage=current_stage, status="running")
             system_logger.info("\n--- ЭТАП 3.5: Глобальная вычитка текста ---")
 
-            all_chunks = db.get_chunks(chunks_db, chapter_name)
-            terms = db.get_terms(glossary_db, source_lang, target_lang)
-            glossary_content = json.dumps([dict(t) for t in terms], ensure_ascii=False, indent=2)
-
-            with ui.progress("global proofreading", 1) as handle:
+            global_window = cfg['workers'].get('global_proofreading_window', 0)
+            with ui.progress("global proofreading", len(_split_into_windows(chunks, global_window))) as handle:
                 updated_chunks, global_success = _run_global_proofreading(
-                    all_chunks,
+                    chunks,
                     global_proofreading_prompt_template,
                     global_proofreading_model,
                     rate_limiter,
@@ -774,6 +1329,8 @@ def run_translation_process(
                     backend=backend,
                     ollama_url=ollama_url,
                     ollama_options=_stage_options(ollama_options, 'global_proofreading'),
+                    window_size=global_window,
+                    executor=executor,
                 )
 
             if not global_success:
@@ -789,6 +1346,8 @@ def run_translation_process(
                 [{'chunk_index': c['chunk_index'], 'content_target': c['content_target'], 'status': 'reading_done'}
                  for c in updated_chunks],
             )
+            chunks = updated_chunks
+            _set_chunk_statuses(chunks, 'reading_done')
 
             db.promote_chapter_stage(
                 chunks_db,
@@ -804,7 +1363,7 @@ def run_translation_process(
         current_stage = "assembly"
         _update_manifest(current_stage=current_stage, status="running")
         system_logger.info("\n--- Сборка итогового файла ---")
-        all_final_chunks = db.get_chunks(chunks_db, chapter_name)
+        all_final_chunks = chunks
         status_counts = db.get_chunk_status_counts(chunks_db, chapter_name)
         if not all_final_chunks:
             raise RuntimeError(f"Глава '{chapter_name}' не содержит чанков. Сборка запрещена.")
@@ -819,11 +1378,10 @@ def run_translation_process(
 
         txt_output_path = volume_paths.output_dir / f'{chapter_name}.txt'
 
-        with open(txt_output_path, 'w', encoding='utf-8') as final_file:
-            for i, chunk in enumerate(final_chunks):
-                final_file.write(chunk['content_target'])
-                if i < len(final_chunks) - 1:
-                    final_file.write("\n\n")
+        txt_output_path.write_text(
+            "\n\n".join(chunk['content_target'] for chunk in final_chunks),
+            encoding='utf-8',
+        )
 
         system_logger.info(f"✅ Глава успешно переведена и собрана в файл: {txt_output_path}")
 
@@ -874,6 +1432,8 @@ def run_translation_process(
         system_logger.critical(f"[Orchestrator] НЕПЕРЕХВАЧЕННАЯ КРИТИЧЕСКАЯ ОШИБКА: {e}", exc_info=True)
         raise
     finally:
+        if executor is not None:
+            _release_executor()
         if lock_payload is not None:
             _release_chapter_lock(lock_file, lock_payload['run_id'])
         if not lock_file.exists():
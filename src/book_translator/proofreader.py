@@ -1,5 +1,3 @@
-import copy
-
 from book_translator.logger import system_logger
 
 def apply_diffs(
@@ -13,8 +11,16 @@ def apply_diffs(
 
     Returns:
         (updated_chunks, applied_count, skipped_count)
+
+    The input list and its dicts are never mutated. The returned list is a
+    shallow copy: a chunk touched by a diff is a new dict, and untouched
+    chunks are the original objects.
     """
-    updated_chunks = copy.deepcopy(chunks)
+    updated_chunks = list(chunks)
+    # chunk_index → list position, built once; the first chunk wins on duplicates.
+    positions: dict[object, int] = {}
+    for i, c in enumerate(updated_chunks):
+        positions.setdefault(c.get("chunk_index"), i)
     applied = 0
     skipped = 0
 
@@ -46,12 +52,11 @@ def apply_diffs(
             continue
 
         # Look up by chunk_index field value, not array position (DB uses 1-based indexing)
-        matching = [i for i, c in enumerate(updated_chunks) if c.get("chunk_index") == chunk_idx]
-        if not matching:
+        pos = positions.get(chunk_idx)
+        if pos is None:
             system_logger.warning(f"Diff skipped: chunk_index={chunk_idx} not found in chunk list")
             skipped += 1
             continue
-        pos = matching[0]
 
         chunk = updated_chunks[pos]
         content = str(chunk.get("content_target", ""))
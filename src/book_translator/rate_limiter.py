@@ -1,24 +1,165 @@
 import threading
 import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from book_translator.exceptions import CancellationError
+
+# Fraction of each quota the limiter actually uses. Provider-side counters
+# drift from ours (clock skew, token estimates), so stay below the hard limit.
+SAFETY_MARGIN = 0.8
+
+_MINUTE = 60.0
+_DAY = 86400.0
+
+# Longest single sleep while waiting for quota when cancellation is wired in;
+# the cancel flag is re-checked between slices.
+_CANCEL_POLL_INTERVAL = 0.5
+
+
+def estimate_tokens(text: str) -> int:
+    """Conservative token estimate for quota accounting.
+
+    ASCII text runs ~4 characters per token, but Japanese/Chinese/Korean often
+    tokenize to a token per character (and Cyrillic to 2–3 characters per
+    token), so every non-ASCII character is counted as a full token.
+    """
+    if text.isascii():
+        return max(1, len(text) // 4)
+    ascii_chars = len(text.encode('ascii', 'ignore'))
+    return max(1, ascii_chars // 4 + (len(text) - ascii_chars))
+
+
+class _Window:
+    """Sliding-window counter: total weight of events within the last `period` seconds."""
+
+    def __init__(self, limit: float, period: float):
+        self.limit = limit
+        self.period = period
+        self.events: deque[tuple[float, float]] = deque()
+        self.used = 0.0
+
+    def _expire(self, now: float) -> None:
+        while self.events and now - self.events[0][0] >= self.period:
+            _, weight = self.events.popleft()
+            self.used -= weight
+
+    def wait_time(self, now: float, weight: float) -> float:
+        """Seconds until `weight` more fits in the window (0.0 if it fits now)."""
+        self._expire(now)
+        if self.used + weight <= self.limit or not self.events:
+            # An empty window always admits, even a single oversized request.
+            return 0.0
+        # Find how many of the oldest events must expire to make room.
+        freed = self.used + weight - self.limit
+        for timestamp, event_weight in self.events:
+            freed -= event_weight
+            if freed <= 0:
+                return timestamp + self.period - now
+        return self.events[-1][0] + self.period - now
+
+    def record(self, now: float, weight: float) -> None:
+        self.events.append((now, weight))
+        self.used += weight
+
 
 class RateLimiter:
     """
     A thread-safe rate limiter that enforces a maximum requests-per-second (RPS) limit.
+
+    Optionally also enforces per-minute request (RPM), per-minute token (TPM)
+    and per-day request (RPD) quotas with sliding windows, using SAFETY_MARGIN
+    of each quota. Use ``with limiter.reserve(tokens):`` to account tokens;
+    plain ``with limiter:`` counts a request with no tokens.
+
+    ``time_source`` and ``sleeper`` default to time.monotonic/time.sleep and
+    can be replaced with a fake clock to exercise the throttling without
+    waiting in real time.
+
+    Quota waits can last up to a minute (RPM/TPM) or a day (RPD). When
+    ``is_cancelled`` is given, waits sleep in short slices and raise
+    CancellationError as soon as it returns True.
+
+    Windows live in this object's memory, so quotas are only enforced across
+    the calls that share one limiter (see orchestrator._get_rate_limiter).
     """
     min_interval: float
     lock: threading.Lock
     last_call_time: float
 
-    def __init__(self, max_rps: float):
+    def __init__(
+        self,
+        max_rps: float,
+        max_rpm: int = 0,
+        max_tpm: int = 0,
+        max_rpd: int = 0,
+        time_source: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], None] = time.sleep,
+        is_cancelled: Callable[[], bool] | None = None,
+    ):
         if max_rps <= 0:
             raise ValueError("max_rps must be greater than 0")
+        for name, value in (('max_rpm', max_rpm), ('max_tpm', max_tpm), ('max_rpd', max_rpd)):
+            if value < 0:
+                raise ValueError(f"{name} must be >= 0 (0 disables the limit)")
         self.min_interval = 1.0 / max_rps
         self.lock = threading.Lock()
         self.last_call_time = 0.0
+        self._now = time_source
+        self._sleep = sleeper
+        self._is_cancelled = is_cancelled
 
-    def __enter__(self):
+        self._quota_lock = threading.Lock()
+        self._request_windows = [
+            _Window(limit * SAFETY_MARGIN, period)
+            for limit, period in ((max_rpm, _MINUTE), (max_rpd, _DAY))
+            if limit
+        ]
+        self._token_window = _Window(max_tpm * SAFETY_MARGIN, _MINUTE) if max_tpm else None
+
+    def _check_cancelled(self) -> None:
+        if self._is_cancelled is not None and self._is_cancelled():
+            raise CancellationError("Rate limiter wait cancelled")
+
+    def _pause(self, seconds: float) -> None:
+        """Sleep for `seconds`, in slices when cancellation is wired in."""
+        if self._is_cancelled is None:
+            self._sleep(seconds)
+            return
+        remaining = seconds
+        while remaining > 0:
+            self._check_cancelled()
+            step = min(remaining, _CANCEL_POLL_INTERVAL)
+            self._sleep(step)
+            remaining -= step
+        self._check_cancelled()
+
+    def _wait_for_quota(self, tokens: int) -> None:
+        if not self._request_windows and self._token_window is None:
+            return
+        while True:
+            with self._quota_lock:
+                now = self._now()
+                wait_time = max(
+                    [w.wait_time(now, 1) for w in self._request_windows]
+                    + ([self._token_window.wait_time(now, tokens)] if self._token_window else [])
+                )
+                if wait_time <= 0:
+                    for window in self._request_windows:
+                        window.record(now, 1)
+                    if self._token_window is not None:
+                        self._token_window.record(now, tokens)
+                    return
+            # Sleep outside the lock, then re-check: another thread may have
+            # taken the freed capacity in the meantime.
+            self._pause(wait_time)
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request of `tokens` estimated tokens is admitted."""
+        self._wait_for_quota(tokens)
         with self.lock:
-            current_time = time.monotonic()
+            current_time = self._now()
             elapsed = current_time - self.last_call_time
             wait_time = self.min_interval - elapsed
             if wait_time > 0:
@@ -27,7 +168,16 @@ class RateLimiter:
                 self.last_call_time = current_time
         # Sleep outside the lock so other threads can schedule their own waits concurrently
         if wait_time > 0:
-            time.sleep(wait_time)
+            self._pause(wait_time)
+
+    @contextmanager
+    def reserve(self, tokens: int) -> Iterator["RateLimiter"]:
+        """Context-manager form of acquire() for token-aware callers."""
+        self.acquire(tokens)
+        yield self
+
+    def __enter__(self):
+        self.acquire()
         return self
 
     def __exit__(self, exc_type: type[BaseException] | None, exc_val: BaseException | None, exc_tb: object | None) -> None:
@@ -24,8 +24,8 @@ def collect_terms_from_responses(raw_responses: list[str]) -> list[dict]:
 
     Each term: {'source': str, 'target': str, 'comment': str}
     """
-    seen_sources: set[str] = set()
-    unique_terms: list[dict] = []
+    # source → first term seen with it; dicts keep insertion order.
+    unique_terms: dict[str, dict] = {}
     total = len(raw_responses)
     parsed_count = 0
 
@@ -44,10 +44,8 @@ def collect_terms_from_responses(raw_responses: list[str]) -> list[dict]:
                 continue
             parsed_count += 1
             for term in terms:
-                src = term.get('source', '')
-                if src and src not in seen_sources:
-                    seen_sources.add(src)
-                    unique_terms.append(term)
+                # First writer wins; setdefault does the lookup and insert in one probe.
+                unique_terms.setdefault(term['source'], term)
         except Exception as e:
             system_logger.warning(
                 f"[TermCollector] Не удалось распарсить ответ: {e}. "
@@ -58,6 +56,6 @@ def collect_terms_from_responses(raw_responses: list[str]) -> list[dict]:
         f"[TermCollector] Обработано {parsed_count}/{total} ответов, "
         f"найдено {len(unique_terms)} уникальных терминов."
     )
-    return unique_terms
+    return list(unique_terms.values())
 
 
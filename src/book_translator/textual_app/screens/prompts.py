@@ -19,6 +19,7 @@ _CLOUD_PROMPT_OPTIONS = [
     ("Поиск терминов (term_discovery)",       "term_discovery"),
     ("Вычитка (proofreading)",                "proofreading"),
     ("Глобальная вычитка (global_proofreading)", "global_proofreading"),
+    ("Единый проход (fused_pipeline)",        "fused_pipeline"),
 ]
 
 # Local (Ollama) prompt options
@@ -38,7 +39,7 @@ _SERIES_FILE_OPTIONS = [
 ]
 
 # Keys that are prompt .txt files
-_PROMPT_KEYS = {"translation", "term_discovery", "proofreading", "global_proofreading"}
+_PROMPT_KEYS = {"translation", "term_discovery", "proofreading", "global_proofreading", "fused_pipeline"}
 # Keys that are .md docs
 _DOC_KEYS = {"world_info", "style_guide"}
 # Separator pseudo-options (not selectable)
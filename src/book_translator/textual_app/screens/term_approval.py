@@ -101,23 +101,16 @@ class TermApprovalScreen(ModalScreen):
 
     def on_mount(self) -> None:
         table = self.query_one("#terms-table", DataTable)
-        table.add_columns("Оригинал", "Перевод", "Комментарий")
-        self._refresh_table()
-
-    def _refresh_table(self) -> None:
-        table = self.query_one("#terms-table", DataTable)
-        cursor = table.cursor_row
-        table.clear()
+        table.add_columns(
+            ("Оригинал", "source"), ("Перевод", "target"), ("Комментарий", "comment"),
+        )
+        # Row keys are stable ids, not positions: edits and deletes touch a
+        # single row instead of rebuilding the whole table.
+        self._row_keys: list[str] = []
         for i, t in enumerate(self._terms):
-            table.add_row(
-                t.get("source", ""),
-                t.get("target", ""),
-                t.get("comment", ""),
-                key=str(i),
-            )
-        # Restore cursor position
-        if self._terms:
-            table.move_cursor(row=min(cursor, len(self._terms) - 1))
+            key = str(i)
+            table.add_row(t.get("source", ""), t.get("target", ""), t.get("comment", ""), key=key)
+            self._row_keys.append(key)
 
     def _get_cursor_index(self) -> int | None:
         """Return the index into self._terms for the current cursor row."""
@@ -140,7 +133,10 @@ class TermApprovalScreen(ModalScreen):
                 "target": result["target"],
                 "comment": result["comment"],
             }
-            self._refresh_table()
+            table = self.query_one("#terms-table", DataTable)
+            row_key = self._row_keys[idx]
+            table.update_cell(row_key, "target", result["target"], update_width=True)
+            table.update_cell(row_key, "comment", result["comment"], update_width=True)
 
         self.app.push_screen(
             _EditTermModal(
@@ -156,7 +152,7 @@ class TermApprovalScreen(ModalScreen):
         if idx is None:
             return
         del self._terms[idx]
-        self._refresh_table()
+        self.query_one("#terms-table", DataTable).remove_row(self._row_keys.pop(idx))
 
     def action_confirm(self) -> None:
         self._import_and_dismiss(self._terms)
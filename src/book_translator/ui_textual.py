@@ -11,6 +11,7 @@ threading.Event для синхронизации между worker-потоко
 from __future__ import annotations
 
 import threading
+import time
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -34,7 +35,15 @@ from book_translator.textual_app.messages import (
 
 
 class TextualProgressHandle:
-    """Прогресс-хэндл, постящий события в экран перевода через post_message."""
+    """Прогресс-хэндл, постящий события в экран перевода через post_message.
+
+    При большом числе воркеров чанки завершаются пачками, поэтому обновления
+    объединяются: не чаще одного сообщения в MIN_POST_INTERVAL секунд.
+    ProgressAdvanced несёт абсолютное значение, так что пропущенные промежуточные
+    значения ничего не теряют; последнее значение досылается таймером или flush().
+    """
+
+    MIN_POST_INTERVAL = 0.25
 
     def __init__(
         self,
@@ -48,11 +57,37 @@ class TextualProgressHandle:
         self._total = total
         self._completed = 0
         self._cancelled = cancelled
+        self._lock = threading.Lock()
+        self._posted = 0
+        self._last_post = 0.0
+        self._timer: threading.Timer | None = None
 
     def advance(self, amount: int = 1) -> None:
         if self._cancelled.is_set():
             raise CancellationError("Translation cancelled")
-        self._completed += amount
+        with self._lock:
+            self._completed += amount
+            wait = self._last_post + self.MIN_POST_INTERVAL - time.monotonic()
+            if wait > 0 and self._completed < self._total:
+                if self._timer is None:
+                    self._timer = threading.Timer(wait, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            self._post_locked()
+
+    def flush(self) -> None:
+        """Отправляет последнее значение прогресса, если оно ещё не отправлено."""
+        with self._lock:
+            if self._completed != self._posted:
+                self._post_locked()
+
+    def _post_locked(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._posted = self._completed
+        self._last_post = time.monotonic()
         # post_message is thread-safe in Textual (uses call_soon_threadsafe internally)
         self._screen.post_message(
             ProgressAdvanced(self._label, self._completed, self._total)
@@ -167,6 +202,7 @@ class TextualBridge:
         try:
             yield handle
         finally:
+            handle.flush()
             self._screen.post_message(ProgressFinished(label))
             # Не сбрасываем _running — оркестратор может запустить следующий этап.
             # _running = False устанавливается только через cancel() или mark_done().
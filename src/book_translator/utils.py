@@ -3,6 +3,7 @@
 """
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import re
@@ -11,8 +12,39 @@ from typing import Any
 
 import json_repair
 
+try:
+    import orjson as _orjson  # optional speed-up: pip install "book-translator[fast]"
+except ImportError:
+    _orjson = None
+
 _logger = logging.getLogger('system')
 
+# How often parse_llm_json had to fall back from strict parsing to json_repair.
+_repair_fallbacks = itertools.count(1)
+
+
+def _repair_json(text: str) -> str:
+    _logger.debug(f"[parse_llm_json] Строгий разбор не удался, json_repair (#{next(_repair_fallbacks)})")
+    return json_repair.repair_json(text)
+
+
+def json_loads(text: str | bytes) -> Any:
+    """json.loads, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the same exception either way.
+    """
+    if _orjson is not None:
+        return _orjson.loads(text)
+    return json.loads(text)
+
+
+def json_dumps(obj: Any) -> str:
+    """Compact, non-ASCII-preserving JSON string, using orjson when installed."""
+    if _orjson is not None:
+        return _orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
 # Matches any opening code fence: ```json, ```text, ```python, ``` etc.
 _CODE_FENCE_OPEN = re.compile(r'^```\w*\s*\n?', re.MULTILINE)
 _CODE_FENCE_CLOSE = re.compile(r'\n?```\s*$', re.MULTILINE)
@@ -55,12 +87,12 @@ def parse_llm_json(raw: str) -> Any:
 
     # Парсим первый уровень
     try:
-        parsed = json.loads(text)
+        parsed = json_loads(text)
     except json.JSONDecodeError:
         # Пробуем json_repair для слегка повреждённых ответов
         try:
-            repaired = json_repair.repair_json(text)
-            parsed = json.loads(repaired)
+            repaired = _repair_json(text)
+            parsed = json_loads(repaired)
         except (json.JSONDecodeError, Exception) as e:
             raise ValueError(f"Не удалось распарсить JSON из ответа LLM: {e}\nОтвет: {raw[:200]!r}")
 
@@ -72,11 +104,11 @@ def parse_llm_json(raw: str) -> Any:
                 raise ValueError("Gemini-cli вернул пустой response в обёртке")
             inner_text = strip_code_fence(response_text)
             try:
-                return json.loads(inner_text)
+                return json_loads(inner_text)
             except json.JSONDecodeError:
                 try:
-                    repaired = json_repair.repair_json(inner_text)
-                    return json.loads(repaired)
+                    repaired = _repair_json(inner_text)
+                    return json_loads(repaired)
                 except Exception as e:
                     _logger.warning(
                         f"[parse_llm_json] Не удалось распарсить inner JSON из обёртки gemini-cli: {e}. "